@@ -1,9 +1,18 @@
 import streamlit as st
 import requests
-from PIL import Image
+import orjson
+from requests.adapters import HTTPAdapter
 import io
+import re
+import hashlib
 import time
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    from PIL import Image
 
 # ============================================================================
 # PAGE CONFIGURATION
@@ -18,127 +27,129 @@ st.set_page_config(
 # ============================================================================
 # CUSTOM CSS FOR PROFESSIONAL STYLING
 # ============================================================================
-st.markdown("""
-    <style>
-    /* Main container styling */
-    .main {
-        padding: 2rem 1rem;
-    }
-    
-    /* Custom card styling */
-    .stCard {
-        border-radius: 12px;
-        padding: 1.5rem;
-        background: rgba(255, 255, 255, 0.05);
-        border: 1px solid rgba(255, 255, 255, 0.1);
-    }
-    
-    /* Upload section styling */
-    [data-testid="stFileUploader"] {
-        padding: 2rem;
-        border-radius: 10px;
-        border: 2px dashed rgba(255, 255, 255, 0.3);
-        background: rgba(255, 255, 255, 0.02);
-    }
-    
-    /* Button styling */
-    .stButton>button {
-        width: 100%;
-        border-radius: 8px;
-        height: 3rem;
-        font-weight: 600;
-        transition: all 0.3s ease;
-    }
-    
-    /* Metric card customization */
-    [data-testid="stMetricValue"] {
-        font-size: 2rem;
-        font-weight: 700;
-    }
-    
-    /* Progress bar styling */
-    .stProgress > div > div > div {
-        border-radius: 10px;
-    }
-    
-    /* Sidebar styling */
-    [data-testid="stSidebar"] {
-        background: rgba(255, 255, 255, 0.02);
-    }
-    
-    /* Custom divider */
-    hr {
-        margin: 2rem 0;
-        border: none;
-        height: 1px;
-        background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
-    }
-    
-    /* Image container */
-    [data-testid="stImage"] {
-        border-radius: 12px;
-        overflow: hidden;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    </style>
-""", unsafe_allow_html=True)
+@st.cache_resource(show_spinner=False)
+def load_css() -> str:
+    """Read style.css once per server, with comments and whitespace stripped."""
+    css = (Path(__file__).parent / "style.css").read_text(encoding="utf-8")
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    return re.sub(r"\s+", " ", css).strip()
+
+# Streamlit drops elements that aren't re-emitted, so this runs on every rerun
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
 
 # ============================================================================
 # CONFIGURATION & CONSTANTS
 # ============================================================================
 TORCHSERVE_URL = "http://localhost:8080/predictions/resnet"
+TORCHSERVE_PING_URL = "http://localhost:8080/ping"
+HEALTH_CHECK_TTL = 5  # seconds
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 ALLOWED_FORMATS = ["jpg", "jpeg", "png", "webp"]
 REQUEST_TIMEOUT = 30  # seconds
+MAX_CONCURRENT_REQUESTS = 4
+PREDICTION_CACHE_TTL = 3600  # seconds
+PREDICTION_CACHE_SIZE = 128  # images
+MAX_IMAGE_EDGE = 512  # px, TorchServe resizes to 224 anyway
+TOP_K_PREDICTIONS = 10  # rows shown in the predictions table
 
 # ============================================================================
-# HELPER FUNCTIONS
+# HTTP SESSION
 # ============================================================================
+# Reuse keep-alive connections to TorchServe across requests and reruns
+if 'http' not in st.session_state:
+    http = requests.Session()
+    http.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONCURRENT_REQUESTS))
+    st.session_state.http = http
+# Worker threads for sending multiple images to TorchServe concurrently
+if 'executor' not in st.session_state:
+    st.session_state.executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
 
-def validate_image(uploaded_file) -> tuple[bool, Optional[str]]:
-    """Validate uploaded image file."""
-    if uploaded_file.size > MAX_FILE_SIZE:
-        return False, "File size exceeds 10MB limit."
-    
-    try:
-        image = Image.open(uploaded_file)
-        image.verify()  # Verify it's a valid image
-        uploaded_file.seek(0)  # Reset file pointer
-        return True, None
-    except Exception as e:
-        return False, f"Invalid image file: {str(e)}"
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
 
-def preprocess_image(image: Image.Image) -> bytes:
+def preprocess_image(image: "Image.Image", original_bytes: bytes, original_format: Optional[str]) -> bytes:
     """Convert PIL Image to bytes for TorchServe."""
+    from PIL import Image  # deferred: only needed once an image is uploaded
+    
+    # Small RGB JPEGs can be sent as uploaded, no need to re-encode
+    if original_format == 'JPEG' and image.mode == 'RGB' and max(image.size) <= MAX_IMAGE_EDGE:
+        return original_bytes
+    
     img_bytes = io.BytesIO()
-    # Convert RGBA to RGB if necessary
-    if image.mode == 'RGBA':
+    # JPEG only stores RGB and grayscale; convert palette, alpha, CMYK, etc.
+    if image.mode not in ('RGB', 'L'):
         image = image.convert('RGB')
-    image.save(img_bytes, format='JPEG', quality=95)
+    # Downscale large images before encoding; BILINEAR is plenty since the server resizes again
+    if max(image.size) > MAX_IMAGE_EDGE:
+        image.thumbnail((MAX_IMAGE_EDGE, MAX_IMAGE_EDGE), Image.Resampling.BILINEAR)
+    image.save(img_bytes, format='JPEG', quality=90, optimize=False, subsampling=2)
     return img_bytes.getvalue()
 
-def get_predictions(image_bytes: bytes) -> tuple[bool, Optional[Dict], Optional[str]]:
-    """Send image to TorchServe and get predictions."""
+def sniff_format(header: bytes) -> Optional[str]:
+    """Identify JPEG, PNG or WEBP from the file signature."""
+    if header[:3] == b'\xff\xd8\xff':
+        return 'JPEG'
+    if header[:8] == b'\x89PNG\r\n\x1a\n':
+        return 'PNG'
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'WEBP'
+    return None
+
+@st.cache_data(show_spinner=False)
+def prepare_image(file_bytes: bytes) -> tuple[bytes, Dict]:
+    """Decode and JPEG-encode an upload, cached on its contents."""
+    from PIL import Image  # deferred: only needed once an image is uploaded
+    
+    image = Image.open(io.BytesIO(file_bytes))
+    # A known signature that matches what PIL parsed is enough; otherwise force
+    # a full decode to validate. Pixels are decoded lazily only if we re-encode.
+    if sniff_format(file_bytes[:16]) != image.format:
+        image.load()
+    metadata = {
+        "format": image.format,
+        "mode": image.mode,
+        "width": image.width,
+        "height": image.height,
+    }
+    return preprocess_image(image, file_bytes, image.format), metadata
+
+def validate_image(file_bytes: bytes) -> tuple[bool, Optional[str], Optional[tuple[bytes, Dict]]]:
+    """Validate uploaded image file and return its prepared bytes and metadata."""
+    if len(file_bytes) > MAX_FILE_SIZE:
+        return False, "File size exceeds 10MB limit.", None
+    
     try:
-        response = requests.post(
-            TORCHSERVE_URL,
-            data=image_bytes,
-            timeout=REQUEST_TIMEOUT,
-            headers={'Content-Type': 'application/octet-stream'}
-        )
-        
-        if response.status_code == 200:
-            predictions = response.json()
-            return True, predictions, None
-        else:
-            error_msg = f"Server returned status {response.status_code}"
-            try:
-                error_detail = response.json()
-                error_msg += f": {error_detail.get('message', response.text)}"
-            except:
-                error_msg += f": {response.text[:200]}"
-            return False, None, error_msg
-            
+        return True, None, prepare_image(file_bytes)
+    except Exception as e:
+        return False, f"Invalid image file: {str(e)}", None
+
+def request_predictions(image_bytes: bytes, http: requests.Session) -> Dict:
+    """Send image to TorchServe and return its predictions, raising on failure."""
+    response = http.post(
+        TORCHSERVE_URL,
+        data=image_bytes,
+        timeout=REQUEST_TIMEOUT,
+        headers={'Content-Type': 'application/octet-stream'}
+    )
+    
+    if response.status_code == 200:
+        return orjson.loads(response.content)
+    
+    error_msg = f"Server returned status {response.status_code}"
+    try:
+        error_detail = orjson.loads(response.content)
+        error_msg += f": {error_detail.get('message', response.text)}"
+    except:
+        error_msg += f": {response.text[:200]}"
+    raise requests.exceptions.HTTPError(error_msg, response=response)
+
+def get_predictions(image_bytes: bytes, http: requests.Session) -> tuple[bool, Optional[Dict], Optional[str]]:
+    """Send image to TorchServe over the given session and get predictions."""
+    try:
+        return True, request_predictions(image_bytes, http), None
+    except requests.exceptions.HTTPError as e:
+        return False, None, str(e)
     except requests.exceptions.ConnectionError:
         return False, None, "Cannot connect to TorchServe. Please ensure Docker container is running on port 8080."
     except requests.exceptions.Timeout:
@@ -146,6 +157,58 @@ def get_predictions(image_bytes: bytes) -> tuple[bool, Optional[Dict], Optional[
     except Exception as e:
         return False, None, f"Unexpected error: {str(e)}"
 
+@st.cache_resource
+def prediction_cache() -> Dict[str, tuple[float, Dict]]:
+    """Image hash -> (time cached, predictions), shared by all sessions."""
+    return {}
+
+def get_cached_predictions(img_hash: str) -> Optional[Dict]:
+    """Cached predictions for an image hash, or None if missing or expired."""
+    entry = prediction_cache().get(img_hash)
+    if entry and time.time() - entry[0] < PREDICTION_CACHE_TTL:
+        return entry[1]
+    return None
+
+def cache_predictions(img_hash: str, predictions: Dict) -> None:
+    """Store predictions, evicting the oldest entries once the cache is full."""
+    cache = prediction_cache()
+    cache.pop(img_hash, None)  # Re-insert so the entry counts as newest
+    cache[img_hash] = (time.time(), predictions)
+    while len(cache) > PREDICTION_CACHE_SIZE:
+        cache.pop(next(iter(cache)), None)
+
+def predict_images(images: list[bytes], http: requests.Session, executor: ThreadPoolExecutor) -> list[tuple[bool, Optional[Dict], Optional[str], bool]]:
+    """Get predictions for each image, from the cache or TorchServe, plus whether it was cached."""
+    img_hashes = [hashlib.blake2b(image_bytes, digest_size=16).hexdigest() for image_bytes in images]
+    cached = [get_cached_predictions(img_hash) for img_hash in img_hashes]
+    
+    # Only cache misses go to TorchServe, concurrently so it can batch them server-side.
+    # Workers can't read st.session_state, so the session is passed in explicitly.
+    futures = {
+        idx: executor.submit(get_predictions, image_bytes, http)
+        for idx, image_bytes in enumerate(images)
+        if cached[idx] is None
+    }
+    
+    outcomes = []
+    for idx, predictions in enumerate(cached):
+        if predictions is not None:
+            outcomes.append((True, predictions, None, True))
+            continue
+        success, predictions, error_msg = futures[idx].result()
+        if success:
+            cache_predictions(img_hashes[idx], predictions)
+        outcomes.append((success, predictions, error_msg, False))
+    return outcomes
+
+@st.cache_data(ttl=HEALTH_CHECK_TTL, show_spinner=False)
+def check_torchserve_health() -> int:
+    """Ping TorchServe and return the HTTP status code, or -1 if unreachable."""
+    try:
+        return st.session_state.http.get(TORCHSERVE_PING_URL, timeout=2).status_code
+    except requests.exceptions.RequestException:
+        return -1
+
 def format_confidence(value: float) -> str:
     """Format confidence score as percentage."""
     return f"{value * 100:.2f}%"
@@ -168,7 +231,7 @@ with st.sidebar:
     
     st.markdown("### 📋 Instructions")
     st.markdown("""
-    1. **Upload** an image (JPG, PNG, WEBP)
+    1. **Upload** one or more images (JPG, PNG, WEBP)
     2. **Click** the Analyze button
     3. **Review** AI predictions with confidence scores
     """)
@@ -185,14 +248,13 @@ with st.sidebar:
     
     # Connection status check
     st.markdown("### 🔌 Status")
-    try:
-        health_check = requests.get("http://localhost:8080/ping", timeout=2)
-        if health_check.status_code == 200:
-            st.success("✅ TorchServe Online")
-        else:
-            st.warning("⚠️ Server Responding (Non-200)")
-    except:
+    health_status = check_torchserve_health()
+    if health_status == 200:
+        st.success("✅ TorchServe Online")
+    elif health_status == -1:
         st.error("❌ TorchServe Offline")
+    else:
+        st.warning("⚠️ Server Responding (Non-200)")
 
 # ============================================================================
 # MAIN CONTENT
@@ -211,8 +273,8 @@ st.markdown("""
 st.divider()
 
 # Initialize session state
-if 'predictions' not in st.session_state:
-    st.session_state.predictions = None
+if 'results' not in st.session_state:
+    st.session_state.results = None
 if 'analysis_time' not in st.session_state:
     st.session_state.analysis_time = None
 
@@ -223,42 +285,50 @@ col1, col2 = st.columns([1.2, 1.8], gap="large")
 
 # --- LEFT COLUMN: IMAGE INPUT ---
 with col1:
-    st.markdown("### 📤 Upload Image")
+    st.markdown("### 📤 Upload Images")
     
-    uploaded_file = st.file_uploader(
-        "Choose an image file",
+    uploaded_files = st.file_uploader(
+        "Choose one or more image files",
         type=ALLOWED_FORMATS,
-        help=f"Supported formats: {', '.join(ALLOWED_FORMATS).upper()} | Max size: {MAX_FILE_SIZE // (1024*1024)}MB"
+        accept_multiple_files=True,
+        help=f"Supported formats: {', '.join(ALLOWED_FORMATS).upper()} | Max size: {MAX_FILE_SIZE // (1024*1024)}MB per file"
     )
     
-    if uploaded_file:
-        # Validate image
-        is_valid, error_msg = validate_image(uploaded_file)
+    # (file name, prepared JPEG bytes) for every upload that passed validation
+    valid_images = []
+    
+    for uploaded_file in uploaded_files:
+        # Validate image (decode and re-encode are cached on the file contents)
+        file_bytes = uploaded_file.getvalue()
+        is_valid, error_msg, prepared = validate_image(file_bytes)
         
         if not is_valid:
-            st.error(f"❌ {error_msg}")
-        else:
-            # Display image
-            image = Image.open(uploaded_file)
-            st.image(image, caption=f"📁 {uploaded_file.name}", use_container_width=True)
+            st.error(f"❌ {uploaded_file.name}: {error_msg}")
+            continue
+        
+        image_bytes, image_info = prepared
+        valid_images.append((uploaded_file.name, image_bytes))
+        
+        # Display image
+        st.image(file_bytes, caption=f"📁 {uploaded_file.name}", use_container_width=True)
+        
+        # Image metadata
+        with st.expander("📊 Image Information"):
+            col_a, col_b = st.columns(2)
+            with col_a:
+                st.metric("Format", image_info["format"])
+                st.metric("Width", f"{image_info['width']}px")
+            with col_b:
+                st.metric("Mode", image_info["mode"])
+                st.metric("Height", f"{image_info['height']}px")
             
-            # Image metadata
-            with st.expander("📊 Image Information"):
-                col_a, col_b = st.columns(2)
-                with col_a:
-                    st.metric("Format", image.format)
-                    st.metric("Width", f"{image.width}px")
-                with col_b:
-                    st.metric("Mode", image.mode)
-                    st.metric("Height", f"{image.height}px")
-                
-                st.caption(f"File size: {uploaded_file.size / 1024:.2f} KB")
+            st.caption(f"File size: {uploaded_file.size / 1024:.2f} KB")
 
 # --- RIGHT COLUMN: PREDICTIONS ---
 with col2:
     st.markdown("### 🎯 Analysis Results")
     
-    if not uploaded_file:
+    if not uploaded_files:
         st.info("👈 Upload an image to begin analysis")
         st.markdown("""
             <div style='text-align: center; padding: 3rem 0;'>
@@ -269,13 +339,13 @@ with col2:
             </div>
         """, unsafe_allow_html=True)
     
-    elif not is_valid:
+    elif not valid_images:
         st.warning("⚠️ Please upload a valid image file")
     
     else:
         # Analyze button
         analyze_btn = st.button(
-            "🔍 Analyze Image",
+            "🔍 Analyze Image" if len(valid_images) == 1 else f"🔍 Analyze {len(valid_images)} Images",
             type="primary",
             use_container_width=True
         )
@@ -285,111 +355,141 @@ with col2:
             progress_bar = st.progress(0)
             status_text = st.empty()
             
-            # Step 1: Preprocessing
-            status_text.text("⏳ Preprocessing image...")
-            progress_bar.progress(25)
-            time.sleep(0.3)
-            
-            image_bytes = preprocess_image(image)
-            
-            # Step 2: Sending request
+            # Images were preprocessed on upload, so go straight to sending them
             status_text.text("📡 Sending to TorchServe...")
             progress_bar.progress(50)
             
             start_time = time.time()
-            success, predictions, error_msg = get_predictions(image_bytes)
+            outcomes = predict_images(
+                [image_bytes for _, image_bytes in valid_images],
+                st.session_state.http,
+                st.session_state.executor
+            )
             analysis_time = time.time() - start_time
             
-            # Step 3: Processing response
-            status_text.text("🔄 Processing results...")
-            progress_bar.progress(75)
-            time.sleep(0.2)
-            
             progress_bar.progress(100)
-            time.sleep(0.3)
             
             # Clear progress indicators
             progress_bar.empty()
             status_text.empty()
             
-            if success:
-                st.session_state.predictions = predictions
-                st.session_state.analysis_time = analysis_time
+            results = []
+            for (name, _), (success, predictions, error_msg, from_cache) in zip(valid_images, outcomes):
+                if success:
+                    results.append({
+                        "name": name,
+                        "from_cache": from_cache,
+                        "predictions": predictions,
+                        "predictions_json": orjson.dumps(predictions, option=orjson.OPT_INDENT_2).decode(),
+                        # Display-ready (label, confidence) pairs for the rows we show,
+                        # formatted once; TorchServe returns classes best-first
+                        "pretty_labels": [
+                            (label.replace('_', ' ').title(), confidence)
+                            for label, confidence in islice(predictions.items(), TOP_K_PREDICTIONS)
+                        ],
+                    })
+                else:
+                    st.error(f"❌ {name}: {error_msg}")
+            
+            st.session_state.results = results or None
+            st.session_state.analysis_time = analysis_time
+            cached_count = sum(result["from_cache"] for result in results)
+            if results and cached_count == len(results):
+                st.success("✅ Loaded cached results (no inference run)")
+            elif cached_count:
+                st.success(f"✅ Analysis complete in {analysis_time:.2f}s ({cached_count} cached)")
+            elif results:
                 st.success(f"✅ Analysis complete in {analysis_time:.2f}s")
-            else:
-                st.error(f"❌ {error_msg}")
-                st.session_state.predictions = None
         
         # Display predictions if available
-        if st.session_state.predictions:
-            predictions = st.session_state.predictions
-            
-            st.divider()
+        if st.session_state.results:
+            import pandas as pd  # deferred: only needed once there are results
             
-            # Top prediction highlight
-            best_label = list(predictions.keys())[0]
-            best_score = list(predictions.values())[0]
-            
-            # Big metric card
-            col_metric1, col_metric2 = st.columns(2)
-            with col_metric1:
-                st.metric(
-                    label="🏆 Top Prediction",
-                    value=best_label.replace('_', ' ').title(),
-                    help="Most confident classification"
-                )
-            with col_metric2:
-                st.metric(
-                    label="📊 Confidence",
-                    value=format_confidence(best_score),
-                    delta="High" if best_score > 0.7 else "Medium" if best_score > 0.4 else "Low",
-                    delta_color="normal" if best_score > 0.7 else "off"
-                )
+            results = st.session_state.results
             
             st.divider()
             
-            # Detailed predictions
-            st.markdown("#### 📈 All Predictions")
+            # One tab per image when several were analyzed
+            if len(results) > 1:
+                containers = st.tabs([f"🖼️ {result['name']}" for result in results])
+            else:
+                containers = [st.container()]
             
-            for idx, (label, confidence) in enumerate(predictions.items(), 1):
-                score_pct = confidence * 100
-                
-                # Create custom layout for each prediction
-                col_label, col_bar, col_value = st.columns([2, 5, 1])
+            for result_idx, (container, result) in enumerate(zip(containers, results)):
+                predictions = result["predictions"]
+                pretty_labels = result["pretty_labels"]
                 
-                with col_label:
+                with container:
+                    # Top prediction highlight
+                    best_label, best_score = pretty_labels[0]
+                    
+                    # Big metric card
+                    col_metric1, col_metric2 = st.columns(2)
+                    with col_metric1:
+                        st.metric(
+                            label="🏆 Top Prediction",
+                            value=best_label,
+                            help="Most confident classification"
+                        )
+                    with col_metric2:
+                        st.metric(
+                            label="📊 Confidence",
+                            value=format_confidence(best_score),
+                            delta="High" if best_score > 0.7 else "Medium" if best_score > 0.4 else "Low",
+                            delta_color="normal" if best_score > 0.7 else "off"
+                        )
+                    
+                    st.divider()
+                    
+                    # Detailed predictions
+                    st.markdown("#### 📈 Top Predictions")
+                    
                     # Add medal emoji for top 3
-                    emoji = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉" if idx == 3 else "▪️"
-                    st.markdown(f"{emoji} **{label.replace('_', ' ').title()}**")
-                
-                with col_bar:
-                    st.progress(min(int(score_pct), 100))
-                
-                with col_value:
-                    st.markdown(f"**{score_pct:.1f}%**")
-            
-            # Additional info
-            st.divider()
-            
-            col_info1, col_info2 = st.columns(2)
-            with col_info1:
-                st.caption(f"⏱️ Analysis time: {st.session_state.analysis_time:.3f}s")
-            with col_info2:
-                st.caption(f"📦 Results: {len(predictions)} classes")
-            
-            # Raw JSON expander
-            with st.expander("🔍 View Raw JSON Response"):
-                st.json(predictions)
-            
-            # Download results button
-            if st.download_button(
-                label="💾 Download Results",
-                data=str(predictions),
-                file_name=f"predictions_{uploaded_file.name}.json",
-                mime="application/json",
-                use_container_width=True
-            ):
-                st.success("✅ Results downloaded!")
+                    medals = ["🥇", "🥈", "🥉"]
+                    predictions_df = pd.DataFrame({
+                        "Class": [
+                            f"{medals[idx] if idx < len(medals) else '▪️'} {label}"
+                            for idx, (label, _) in enumerate(pretty_labels)
+                        ],
+                        "Confidence": [confidence * 100 for _, confidence in pretty_labels],
+                    })
+                    st.dataframe(
+                        predictions_df,
+                        column_config={
+                            "Confidence": st.column_config.ProgressColumn(
+                                format="%.1f%%", min_value=0, max_value=100
+                            )
+                        },
+                        hide_index=True,
+                        use_container_width=True
+                    )
+                    
+                    # Additional info
+                    st.divider()
+                    
+                    col_info1, col_info2 = st.columns(2)
+                    with col_info1:
+                        if result["from_cache"]:
+                            st.caption("⏱️ Cached result (no inference run)")
+                        else:
+                            st.caption(f"⏱️ Analysis time: {st.session_state.analysis_time:.3f}s")
+                    with col_info2:
+                        st.caption(f"📦 Results: {len(predictions)} classes")
+                    
+                    # Raw JSON expander
+                    with st.expander("🔍 View Raw JSON Response"):
+                        st.json(predictions)
+                    
+                    # Download results button
+                    if st.download_button(
+                        label="💾 Download Results",
+                        data=result["predictions_json"],
+                        file_name=f"predictions_{result['name']}.json",
+                        mime="application/json",
+                        use_container_width=True,
+                        key=f"download_{result_idx}"
+                    ):
+                        st.success("✅ Results downloaded!")
 
 # ============================================================================
 # FOOTER
@@ -10,9 +10,16 @@ print("⬇️  Downloading ResNet-18 Model...")
 try:
     model = models.resnet18(weights=models.ResNet18_Weights.IMAGENET1K_V1)
     model.eval()
-    dummy_input = torch.rand(1, 3, 224, 224)
+    # channels_last speeds up CPU convolutions; weights stay FP32 because the
+    # stock image_classifier handler feeds FP32 tensors
+    model = model.to(memory_format=torch.channels_last)
+    dummy_input = torch.rand(1, 3, 224, 224).to(memory_format=torch.channels_last)
     traced_model = torch.jit.trace(model, dummy_input)
+    # Freeze and fuse (e.g. conv + batchnorm) for inference
+    traced_model = torch.jit.freeze(traced_model)
     traced_model.save("resnet18.pt")
+    # Make sure the exported file loads and runs the way TorchServe will use it
+    torch.jit.load("resnet18.pt")(torch.rand(4, 3, 224, 224))
     print("✅ Model saved: resnet18.pt")
 except Exception as e:
     print(f"❌ Error saving model: {e}")